@@ -15,7 +15,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, Any, Union
-import copy
 import logging
 from dataclasses import asdict
 import warnings
@@ -39,6 +38,9 @@ from .session import Session
 
 logger = logging.getLogger(__name__)
 
+# Default option values, built once. ``Options._merge_options`` deep copies it on use.
+_DEFAULT_OPTIONS = asdict(Options())
+
 
 class BasePrimitive(ABC):
     """Base class for Qiskit Runtime primitives."""
@@ -78,14 +80,12 @@ class BasePrimitive(ABC):
         self._service: QiskitRuntimeService = None
         self._backend: Optional[IBMBackend] = None
 
-        if options is None:
-            self._options = asdict(Options())
-        elif isinstance(options, Options):
-            self._options = asdict(copy.deepcopy(options))
+        # ``asdict`` recursively copies the field values, and ``_merge_options``
+        # deep copies both of its arguments, so no additional copy is needed here.
+        if isinstance(options, Options):
+            self._options = asdict(options)
         else:
-            options_copy = copy.deepcopy(options)
-            default_options = asdict(Options())
-            self._options = Options._merge_options(default_options, options_copy)
+            self._options = Options._merge_options(_DEFAULT_OPTIONS, options)
 
         if isinstance(session, Session):
             self._session = session
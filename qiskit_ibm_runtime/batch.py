@@ -27,8 +27,16 @@ class Batch(Session):
         service: Optional[QiskitRuntimeService] = None,
         backend: Optional[Union[str, IBMBackend]] = None,
         max_time: Optional[Union[int, str]] = None,
+        cache: bool = False,
+        track_jobs: bool = False,
     ):
-        super().__init__(service=service, backend=backend, max_time=max_time)
+        super().__init__(
+            service=service,
+            backend=backend,
+            max_time=max_time,
+            cache=cache,
+            track_jobs=track_jobs,
+        )
 
     def _create_session(self) -> str:
         """Create a session."""
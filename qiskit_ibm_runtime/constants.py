@@ -12,6 +12,8 @@
 
 """Constant values."""
 
+from typing import Dict, List, Type, Union
+
 from qiskit.providers.jobstatus import JobStatus
 
 from .utils.result_decoder import ResultDecoder
@@ -36,7 +38,7 @@ API_TO_JOB_ERROR_MESSAGE = {
     "Job was cancelled:\n{}",
 }
 
-DEFAULT_DECODERS = {
+DEFAULT_DECODERS: Dict[str, Union[Type[ResultDecoder], List[Type[ResultDecoder]]]] = {
     "sampler": [ResultDecoder, SamplerResultDecoder],
     "estimator": [ResultDecoder, EstimatorResultDecoder],
     "circuit-runner": RunnerResult,
@@ -21,6 +21,8 @@ ExecutionSupportedOptions = Literal[
     "init_qubits",
 ]
 
+_SUPPORTED_OPTIONS = frozenset(get_args(ExecutionSupportedOptions))
+
 
 @dataclass
 class ExecutionOptions:
@@ -43,5 +45,5 @@ class ExecutionOptions:
             ValueError: if any execution option is not supported
         """
         for opt in execution_options:
-            if not opt in get_args(ExecutionSupportedOptions):
+            if opt not in _SUPPORTED_OPTIONS:
                 raise ValueError(f"Unsupported value '{opt}' for execution.")
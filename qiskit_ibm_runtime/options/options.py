@@ -153,11 +153,9 @@ class Options:
             }
         )
 
-        known_keys = list(Options.__dataclass_fields__.keys())
-        known_keys.append("image")
         # Add additional unknown keys.
         for key in options.keys():
-            if key not in known_keys:
+            if key not in _KNOWN_KEYS:
                 warnings.warn(f"Key '{key}' is an unrecognized option. It may be ignored.")
                 inputs[key] = options[key]
         return inputs
@@ -277,3 +275,7 @@ class Options:
         combined.update(new_options_copy)
 
         return combined
+
+
+# Option keys that are consumed above rather than passed through as unknown inputs.
+_KNOWN_KEYS = frozenset(Options.__dataclass_fields__).union({"image"})
@@ -30,6 +30,10 @@ ExtrapolatorType = Literal[
     "QuarticExtrapolator",
 ]
 
+_SUPPORTED_OPTIONS = frozenset(get_args(ResilienceSupportedOptions))
+_NOISE_AMPLIFIERS = frozenset(get_args(NoiseAmplifierType))
+_EXTRAPOLATORS = frozenset(get_args(ExtrapolatorType))
+
 
 @dataclass
 class ResilienceOptions:
@@ -68,16 +72,16 @@ class ResilienceOptions:
             ValueError: if extrapolator == "CubicExtrapolator" and number of noise_factors < 4.
         """
         for opt in resilience_options:
-            if not opt in get_args(ResilienceSupportedOptions):
+            if opt not in _SUPPORTED_OPTIONS:
                 raise ValueError(f"Unsupported value '{opt}' for resilience.")
         noise_amplifier = resilience_options.get("noise_amplifier") or "LocalFoldingAmplifier"
-        if noise_amplifier not in get_args(NoiseAmplifierType):
+        if noise_amplifier not in _NOISE_AMPLIFIERS:
             raise ValueError(
                 f"Unsupported value {noise_amplifier} for noise_amplifier. "
                 f"Supported values are {get_args(NoiseAmplifierType)}"
             )
         extrapolator = resilience_options.get("extrapolator")
-        if extrapolator and extrapolator not in get_args(ExtrapolatorType):
+        if extrapolator and extrapolator not in _EXTRAPOLATORS:
             raise ValueError(
                 f"Unsupported value {extrapolator} for extrapolator. "
                 f"Supported values are {get_args(ExtrapolatorType)}"
@@ -31,6 +31,8 @@ SimulatorSupportedOptions = Literal[
     "basis_gates",
 ]
 
+_SUPPORTED_OPTIONS = frozenset(get_args(SimulatorSupportedOptions))
+
 
 @dataclass()
 class SimulatorOptions:
@@ -65,7 +67,7 @@ class SimulatorOptions:
             ValueError: if any simulator option is not supported
         """
         for opt in simulator_options:
-            if not opt in get_args(SimulatorSupportedOptions):
+            if opt not in _SUPPORTED_OPTIONS:
                 raise ValueError(f"Unsupported value '{opt}' for simulator.")
 
     def set_backend(self, backend: Union[BackendV1, BackendV2]) -> None:
@@ -37,6 +37,10 @@ RoutingMethodType = Literal[
     "none",
 ]
 
+_SUPPORTED_OPTIONS = frozenset(get_args(TranspilationSupportedOptions))
+_LAYOUT_METHODS = frozenset(get_args(LayoutMethodType))
+_ROUTING_METHODS = frozenset(get_args(RoutingMethodType))
+
 
 @dataclass
 class TranspilationOptions:
@@ -75,16 +79,16 @@ class TranspilationOptions:
             ValueError: if approximation_degree in not None or in the range 0.0 to 1.0.
         """
         for opt in transpilation_options:
-            if not opt in get_args(TranspilationSupportedOptions):
+            if opt not in _SUPPORTED_OPTIONS:
                 raise ValueError(f"Unsupported value '{opt}' for transpilation.")
         layout_method = transpilation_options.get("layout_method")
-        if not (layout_method in get_args(LayoutMethodType) or layout_method is None):
+        if not (layout_method in _LAYOUT_METHODS or layout_method is None):
             raise ValueError(
                 f"Unsupported value {layout_method} for layout_method. "
                 f"Supported values are {get_args(LayoutMethodType)} and None"
             )
         routing_method = transpilation_options.get("routing_method")
-        if not (routing_method in get_args(RoutingMethodType) or routing_method is None):
+        if not (routing_method in _ROUTING_METHODS or routing_method is None):
             raise ValueError(
                 f"Unsupported value {routing_method} for routing_method. "
                 f"Supported values are {get_args(RoutingMethodType)} and None"
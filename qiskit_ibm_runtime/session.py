@@ -12,9 +12,14 @@
 
 """Qiskit Runtime flexible session."""
 
-from typing import Dict, Optional, Type, Union, Callable, Any
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union, Callable, Any
 from types import TracebackType
-from functools import wraps
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent import futures
+
+from qiskit.providers.jobstatus import JobStatus
 
 from qiskit_ibm_runtime import QiskitRuntimeService
 from .runtime_job import RuntimeJob
@@ -23,18 +28,7 @@ from .ibm_backend import IBMBackend
 from .utils.default_session import set_cm_session
 from .utils.deprecation import deprecate_arguments, issue_deprecation_msg
 from .utils.converters import hms_to_seconds
-
-
-def _active_session(func):  # type: ignore
-    """Decorator used to ensure the session is active."""
-
-    @wraps(func)
-    def _wrapper(self, *args, **kwargs):  # type: ignore
-        if not self._active:
-            raise RuntimeError("The session is closed.")
-        return func(self, *args, **kwargs)
-
-    return _wrapper
+from .utils.json import RuntimeEncoder
 
 
 class Session:
@@ -72,11 +66,16 @@ class Session:
 
     """
 
+    _MAX_RESULT_WORKERS = 8
+    _MAX_CACHED_JOBS = 64
+
     def __init__(
         self,
         service: Optional[QiskitRuntimeService] = None,
         backend: Optional[Union[str, IBMBackend]] = None,
         max_time: Optional[Union[int, str]] = None,
+        cache: bool = False,
+        track_jobs: bool = False,
     ):  # pylint: disable=line-too-long
         """Session constructor.
 
@@ -96,6 +95,15 @@ class Session:
                 `system imposed maximum
                 <https://docs.quantum.ibm.com/run/max-execution-time>`_.
 
+            cache: If ``True``, running a program with the same inputs and options
+                as an earlier call returns the job submitted by that call instead of
+                submitting a new one, unless that job failed or was cancelled. The
+                ``callback`` and ``result_decoder`` of the repeated call are ignored.
+                The most recently used jobs are cached, up to 64.
+
+            track_jobs: If ``True``, the session keeps the jobs it submits so that their
+                results can be retrieved with :meth:`results`.
+
         Raises:
             ValueError: If an input value is invalid.
         """
@@ -124,6 +132,11 @@ class Session:
         self._instance = None
 
         self._active = True
+        self._terminal_status: Optional[str] = None
+        self._jobs: Optional[List[RuntimeJob]] = [] if track_jobs else None
+        self._job_cache: Optional["OrderedDict[Tuple[str, str], RuntimeJob]"] = (
+            OrderedDict() if cache else None
+        )
         self._max_time = (
             max_time
             if max_time is None or isinstance(max_time, int)
@@ -152,14 +165,13 @@ class Session:
         )
         return session.get("id")
 
-    @_active_session
     def run(
         self,
         program_id: str,
         inputs: Dict,
         options: Optional[Dict] = None,
         callback: Optional[Callable] = None,
-        result_decoder: Optional[Type[ResultDecoder]] = None,
+        result_decoder: Optional[Union[Type[ResultDecoder], Sequence[Type[ResultDecoder]]]] = None,
     ) -> RuntimeJob:
         """Run a program in the session.
 
@@ -173,29 +185,109 @@ class Session:
 
         Returns:
             Submitted job.
+
+        Raises:
+            RuntimeError: If the session is closed.
         """
+        if not self._active:
+            raise RuntimeError("The session is closed.")
 
-        options = options or {}
+        cache_key = None
+        job = None
+        if self._job_cache is not None:
+            # The instance and backend are the same for every job in the session,
+            # and the backend may only be known after the first job is submitted.
+            cache_key = self._cache_key(program_id, inputs, options or {})
+            cached_job = self._job_cache.pop(cache_key, None)
+            if cached_job is not None and cached_job.status() not in (
+                JobStatus.ERROR,
+                JobStatus.CANCELLED,
+            ):
+                job = cached_job
+
+        if job is None:
+            # Build a new dictionary instead of updating the caller's options in place.
+            options = {"instance": self._instance, **(options or {}), "backend": self._backend}
+
+            job = self._service.run(
+                program_id=program_id,
+                options=options,
+                inputs=inputs,
+                session_id=self._session_id,
+                start_session=False,
+                callback=callback,
+                result_decoder=result_decoder,
+            )
 
-        if "instance" not in options:
-            options["instance"] = self._instance
+            if self._backend is None:
+                self._backend = job.backend().name
 
-        options["backend"] = self._backend
+        if self._jobs is not None:
+            self._jobs.append(job)
+        if cache_key is not None:
+            self._job_cache[cache_key] = job
+            if len(self._job_cache) > self._MAX_CACHED_JOBS:
+                self._job_cache.popitem(last=False)
+        return job
 
-        job = self._service.run(
-            program_id=program_id,
-            options=options,
-            inputs=inputs,
-            session_id=self._session_id,
-            start_session=False,
-            callback=callback,
-            result_decoder=result_decoder,
-        )
+    @staticmethod
+    def _cache_key(program_id: str, inputs: Dict, options: Dict) -> Optional[Tuple[str, str]]:
+        """Return the key of a program run in the job cache.
 
-        if self._backend is None:
-            self._backend = job.backend().name
+        Args:
+            program_id: Program ID.
+            inputs: Program input parameters.
+            options: Runtime options.
 
-        return job
+        Returns:
+            The program ID and a hash of the inputs and options, or ``None`` if
+            they cannot be serialized in a canonical form.
+        """
+        try:
+            data = json.dumps(
+                {"inputs": inputs, "options": options}, cls=RuntimeEncoder, sort_keys=True
+            )
+        except TypeError:
+            return None
+        return program_id, hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def results(self, timeout: Optional[float] = None) -> List[Any]:
+        """Return the results of the jobs submitted through this session instance
+        since the previous call.
+
+        The results are retrieved concurrently, which is faster than calling
+        ``job.result()`` on each job in turn when many jobs were submitted, for
+        example in batch mode.
+
+        Each call to :meth:`run` counts once, including calls for which the session
+        ``cache`` returned an earlier job. This requires the session to be created with
+        ``track_jobs=True``. The session then keeps a reference to every job it submits,
+        and its result, until the result is returned by this method, so long running
+        sessions should call it regularly. If retrieving a result fails, the jobs are
+        kept and the call can be repeated.
+
+        Args:
+            timeout: Number of seconds to wait for each job.
+
+        Returns:
+            Job results, in the order the jobs were submitted.
+
+        Raises:
+            RuntimeError: If the session does not track its jobs.
+        """
+        if self._jobs is None:
+            raise RuntimeError("The session does not track its jobs, set track_jobs=True.")
+        jobs = list(self._jobs)
+        if not jobs:
+            return []
+        with futures.ThreadPoolExecutor(
+            max_workers=min(self._MAX_RESULT_WORKERS, len(jobs)),
+            thread_name_prefix="session_results",
+        ) as executor:
+            results = list(executor.map(lambda job: job.result(timeout=timeout), jobs))
+        # Jobs submitted while the results were retrieved are kept for the next call.
+        del self._jobs[: len(jobs)]
+        return results
 
     def cancel(self) -> None:
         """Cancel all pending jobs in a session."""
@@ -231,6 +323,10 @@ class Session:
             Closed: max_time expired or session was explicitly closed.
             None: status details are not available.
         """
+        # A closed session cannot change state again, so skip querying the server.
+        if self._terminal_status:
+            return self._terminal_status
+
         details = self.details()
         if details:
             state = details["state"]
@@ -241,7 +337,10 @@ class Session:
                 return "In progress, accepting new jobs"
             if state == "active" and not accepting_jobs:
                 return "In progress, not accepting new jobs"
-            return state.capitalize()
+            status = state.capitalize()
+            if state == "closed":
+                self._terminal_status = status
+            return status
 
         return None
 
@@ -22,10 +22,13 @@ import inspect
 import io
 import json
 import re
+import threading
 import warnings
+import weakref
 import zlib
+from collections import OrderedDict
 from datetime import date
-from typing import Any, Callable, Dict, List, Union, Tuple
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
 
 import dateutil.parser
 import numpy as np
@@ -45,6 +48,7 @@ except ImportError:
     HAS_AER = False
 
 from qiskit.circuit import (
+    Barrier,
     Instruction,
     Parameter,
     ParameterExpression,
@@ -52,7 +56,9 @@ from qiskit.circuit import (
     QuantumCircuit,
     QuantumRegister,
 )
+from qiskit.circuit.library.standard_gates import get_standard_gate_name_mapping
 from qiskit.circuit.parametertable import ParameterView
+from qiskit.primitives.utils import _circuit_key
 from qiskit.result import Result
 from qiskit.version import __version__ as _terra_version_string
 from qiskit.utils import optionals
@@ -69,6 +75,16 @@ _TERRA_VERSION = tuple(
     int(x) for x in re.match(r"\d+\.\d+\.\d", _terra_version_string).group(0).split(".")[:3]
 )
 
+_CIRCUIT_CACHE_SIZE = 128
+_circuit_cache: "OrderedDict[Tuple, Tuple[weakref.ref, str]]" = OrderedDict()
+_circuit_cache_lock = threading.Lock()
+# Entries of collected circuits that could not be removed right away.
+_collected_circuits: List[Tuple[Tuple, weakref.ref]] = []
+# Operations whose encoding is fully determined by the circuit key.
+_CACHEABLE_OPERATIONS = frozenset(
+    gate.base_class for gate in get_standard_gate_name_mapping().values()
+).union({Barrier})
+
 
 def to_base64_string(data: str) -> str:
     """Convert string to base64 string.
@@ -106,6 +122,141 @@ def _serialize_and_encode(
     return base64.standard_b64encode(serialized_data).decode("utf-8")
 
 
+def _serialize_circuit(circuit: QuantumCircuit) -> str:
+    """Serialize a circuit using QPY and return the encoded string."""
+    kwargs: Dict[str, object] = {"use_symengine": bool(optionals.HAS_SYMENGINE)}
+    if _TERRA_VERSION[0] >= 1:
+        # NOTE: This can be updated only after the server side has
+        # updated to a newer qiskit version.
+        kwargs["version"] = 10
+    return _serialize_and_encode(
+        data=circuit,
+        serializer=lambda buff, data: dump(
+            data, buff, RuntimeEncoder, **kwargs
+        ),  # type: ignore[no-untyped-call]
+    )
+
+
+def _operations_key(circuit: QuantumCircuit) -> Optional[Tuple]:
+    """Return the instruction attributes of a circuit that ``_circuit_key`` ignores.
+
+    Args:
+        circuit: Circuit to key.
+
+    Returns:
+        The key, or ``None`` if the circuit has operations other than standard gates,
+        whose definitions cannot be keyed cheaply.
+    """
+    key = []
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if getattr(operation, "base_class", None) not in _CACHEABLE_OPERATIONS:
+            return None
+        key.append(
+            (
+                operation.label,
+                operation.condition,
+                getattr(operation, "ctrl_state", None),
+                operation.duration,
+                operation.unit,
+            )
+        )
+    return tuple(key)
+
+
+def _layout_key(circuit: QuantumCircuit) -> Optional[Tuple]:
+    """Return the key of the layout of a transpiled circuit."""
+    layout = circuit._layout
+    if layout is None:
+        return None
+    return (
+        tuple(layout.initial_layout.get_virtual_bits().items()),
+        tuple(layout.input_qubit_mapping.items()),
+        None
+        if layout.final_layout is None
+        else tuple(layout.final_layout.get_virtual_bits().items()),
+        layout._input_qubit_count,
+        None if layout._output_qubit_list is None else tuple(layout._output_qubit_list),
+    )
+
+
+def _remove_circuit_entry(key: Tuple, ref: weakref.ref) -> None:
+    """Remove a cache entry if it still belongs to ``ref``. The cache lock must be held."""
+    entry = _circuit_cache.get(key)
+    if entry is not None and entry[0] is ref:
+        del _circuit_cache[key]
+
+
+def _circuit_collected(key: Tuple) -> Callable[[weakref.ref], None]:
+    """Return a callback removing the cache entry of a circuit once it is collected."""
+
+    def _callback(ref: weakref.ref) -> None:
+        # The circuit can be collected while the cache is in use, in which case the
+        # entry is removed on the next access instead.
+        if _circuit_cache_lock.acquire(blocking=False):
+            try:
+                _remove_circuit_entry(key, ref)
+            finally:
+                _circuit_cache_lock.release()
+        else:
+            _collected_circuits.append((key, ref))
+
+    return _callback
+
+
+def _encode_circuit(circuit: QuantumCircuit) -> str:
+    """Return the encoded string of a circuit, reusing a previous encoding if possible.
+
+    Iterative workloads submit the same circuit objects over and over with only the
+    parameter values changing, so the encoded circuits are kept in a small LRU cache.
+    Entries are keyed by the circuit object and everything its encoding depends on,
+    so a circuit that is modified between calls is encoded again. Only circuits made
+    of standard gates are cached, and never those with metadata or calibrations, since
+    anything else cannot be keyed cheaply. Each entry holds a weak reference to its
+    circuit: a new circuit that reuses the ``id`` of a collected one is never given its
+    encoding, and the entry is removed when the circuit is collected.
+
+    Args:
+        circuit: Circuit to encode.
+
+    Returns:
+        Encoded circuit.
+    """
+    if circuit.metadata or circuit.calibrations:
+        return _serialize_circuit(circuit)
+    try:
+        operations_key = _operations_key(circuit)
+        if operations_key is None:
+            return _serialize_circuit(circuit)
+        key = (
+            id(circuit),
+            circuit.global_phase,
+            tuple(circuit.qregs),
+            tuple(circuit.cregs),
+            _layout_key(circuit),
+            _circuit_key(circuit, functional=False),
+            operations_key,
+        )
+        hash(key)
+    except TypeError:
+        return _serialize_circuit(circuit)
+
+    with _circuit_cache_lock:
+        while _collected_circuits:
+            _remove_circuit_entry(*_collected_circuits.pop())
+        entry = _circuit_cache.get(key)
+        if entry is not None and entry[0]() is circuit:
+            _circuit_cache.move_to_end(key)
+            return entry[1]
+
+    value = _serialize_circuit(circuit)
+    with _circuit_cache_lock:
+        _circuit_cache[key] = (weakref.ref(circuit, _circuit_collected(key)), value)
+        if len(_circuit_cache) > _CIRCUIT_CACHE_SIZE:
+            _circuit_cache.popitem(last=False)
+    return value
+
+
 def _decode_and_deserialize(data: str, deserializer: Callable, decompress: bool = True) -> Any:
     """Decode and deserialize input data.
 
@@ -215,18 +366,7 @@ class RuntimeEncoder(json.JSONEncoder):
         if hasattr(obj, "to_json"):
             return {"__type__": "to_json", "__value__": obj.to_json()}
         if isinstance(obj, QuantumCircuit):
-            kwargs: Dict[str, object] = {"use_symengine": bool(optionals.HAS_SYMENGINE)}
-            if _TERRA_VERSION[0] >= 1:
-                # NOTE: This can be updated only after the server side has
-                # updated to a newer qiskit version.
-                kwargs["version"] = 10
-            value = _serialize_and_encode(
-                data=obj,
-                serializer=lambda buff, data: dump(
-                    data, buff, RuntimeEncoder, **kwargs
-                ),  # type: ignore[no-untyped-call]
-            )
-            return {"__type__": "QuantumCircuit", "__value__": value}
+            return {"__type__": "QuantumCircuit", "__value__": _encode_circuit(obj)}
         if isinstance(obj, Parameter):
             value = _serialize_and_encode(
                 data=obj,
@@ -245,7 +385,7 @@ class RuntimeEncoder(json.JSONEncoder):
         if isinstance(obj, ParameterView):
             return obj.data
         if isinstance(obj, Instruction):
-            kwargs = {"use_symengine": bool(optionals.HAS_SYMENGINE)}
+            kwargs: Dict[str, object] = {"use_symengine": bool(optionals.HAS_SYMENGINE)}
             if _TERRA_VERSION[0] >= 1:
                 # NOTE: This can be updated only after the server side has
                 # updated to a newer qiskit version.
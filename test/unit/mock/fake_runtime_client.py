@@ -12,12 +12,14 @@
 
 """Fake RuntimeClient."""
 
+import asyncio
 import base64
+import itertools
 import json
-import time
+import threading
 import uuid
+from collections import defaultdict
 from datetime import timezone, datetime as python_datetime
-from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
@@ -28,10 +30,40 @@ from qiskit_ibm_runtime.utils import RuntimeEncoder
 
 from .fake_api_backend import FakeApiBackend, FakeApiBackendSpecs
 
+# Results are identical for every job, so they are only encoded once.
+_SAMPLER_RESULT = json.dumps({"quasi_dists": [{0: 0.5, 3: 0.5}], "metadata": []})
+
+# Job IDs only need to be unique within the process, so a counter is enough.
+_job_counter = itertools.count()
+
+_PENDING_STATUSES = frozenset({"QUEUED", "RUNNING"})
+_RETURNED_STATUSES = frozenset({"COMPLETED", "FAILED", "CANCELLED"})
+_FINAL_STATUSES = _RETURNED_STATUSES | {"CANCELLED - RAN TOO LONG"}
+
+
+def _start_event_loop():
+    """Start an event loop running forever in a daemon thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
 
 class BaseFakeProgram:
     """Base class for faking a program."""
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_data",
+        "_cost",
+        "_description",
+        "_backend_requirements",
+        "_parameters",
+        "_return_values",
+        "_interim_results",
+        "_is_public",
+    )
+
     def __init__(
         self,
         program_id,
@@ -86,9 +118,37 @@ class BaseFakeProgram:
 class BaseFakeRuntimeJob:
     """Base class for faking a runtime job."""
 
+    __slots__ = (
+        "_job_id",
+        "_status",
+        "_reason",
+        "_program_id",
+        "_hub",
+        "_group",
+        "_project",
+        "_backend_name",
+        "_params",
+        "_image",
+        "_interim_results",
+        "_job_tags",
+        "log_level",
+        "_session_id",
+        "_max_execution_time",
+        "_start_session",
+        "_creation_date",
+        "_result",
+        "_final_status",
+        "_channel_strategy",
+        "_future",
+    )
+
     _job_progress = ["QUEUED", "RUNNING", "COMPLETED"]
 
-    _executor = ThreadPoolExecutor()  # pylint: disable=bad-option-value,consider-using-with
+    # Seconds spent in each status of ``_job_progress``. Override in timing-sensitive tests.
+    _progress_delay = 0.0
+
+    # All fake jobs progress as coroutines on a single shared event loop.
+    _loop = _start_event_loop()
 
     def __init__(
         self,
@@ -119,29 +179,30 @@ class BaseFakeRuntimeJob:
         self._backend_name = backend_name
         self._params = params
         self._image = image
-        self._interim_results = json.dumps({"quasi_dists": [{0: 0.5, 3: 0.5}], "metadata": []})
+        self._interim_results = _SAMPLER_RESULT
         self._job_tags = job_tags
         self.log_level = log_level
         self._session_id = session_id
         self._max_execution_time = max_execution_time
         self._start_session = start_session
         self._creation_date = python_datetime.now(timezone.utc)
-        if final_status is None:
-            self._future = self._executor.submit(self._auto_progress)
-            self._result = None
-        elif final_status == "COMPLETED":
-            self._result = json.dumps({"quasi_dists": [{0: 0.5, 3: 0.5}], "metadata": []})
+        self._result = None
+        if final_status == "COMPLETED":
+            self._result = _SAMPLER_RESULT
         self._final_status = final_status
         self._channel_strategy = channel_strategy
+        # Start progressing only once the job is fully initialized.
+        if final_status is None:
+            self._future = asyncio.run_coroutine_threadsafe(self._auto_progress(), self._loop)
 
-    def _auto_progress(self):
+    async def _auto_progress(self):
         """Automatically update job status."""
         for status in self._job_progress:
-            time.sleep(0.5)
+            await asyncio.sleep(self._progress_delay)
             self._status = status
 
         if self._status == "COMPLETED":
-            self._result = json.dumps({"quasi_dists": [{0: 0.5, 3: 0.5}], "metadata": []})
+            self._result = _SAMPLER_RESULT
 
     def to_dict(self):
         """Convert to dictionary format."""
@@ -173,11 +234,13 @@ class BaseFakeRuntimeJob:
 class FailedRuntimeJob(BaseFakeRuntimeJob):
     """Class for faking a failed runtime job."""
 
+    __slots__ = ()
+
     _job_progress = ["QUEUED", "RUNNING", "FAILED"]
 
-    def _auto_progress(self):
+    async def _auto_progress(self):
         """Automatically update job status."""
-        super()._auto_progress()
+        await super()._auto_progress()
 
         if self._status == "FAILED":
             self._result = "Kaboom!"
@@ -186,11 +249,13 @@ class FailedRuntimeJob(BaseFakeRuntimeJob):
 class FailedRanTooLongRuntimeJob(BaseFakeRuntimeJob):
     """Class for faking a failed runtime job."""
 
+    __slots__ = ()
+
     _job_progress = ["QUEUED", "RUNNING", "CANCELLED"]
 
-    def _auto_progress(self):
+    async def _auto_progress(self):
         """Automatically update job status."""
-        super()._auto_progress()
+        await super()._auto_progress()
 
         if self._status == "CANCELLED":
             self._reason = "RAN TOO LONG"
@@ -200,6 +265,8 @@ class FailedRanTooLongRuntimeJob(BaseFakeRuntimeJob):
 class CancelableRuntimeJob(BaseFakeRuntimeJob):
     """Class for faking a cancelable runtime job."""
 
+    __slots__ = ("_cancelled",)
+
     _job_progress = ["QUEUED", "RUNNING"]
 
     def __init__(self, *args, **kwargs):
@@ -223,11 +290,13 @@ class CancelableRuntimeJob(BaseFakeRuntimeJob):
 class CustomResultRuntimeJob(BaseFakeRuntimeJob):
     """Class for using custom job result."""
 
+    __slots__ = ()
+
     custom_result = "bar"
 
-    def _auto_progress(self):
+    async def _auto_progress(self):
         """Automatically update job status."""
-        super()._auto_progress()
+        await super()._auto_progress()
 
         if self._status == "COMPLETED":
             self._result = json.dumps(self.custom_result, cls=RuntimeEncoder)
@@ -236,17 +305,19 @@ class CustomResultRuntimeJob(BaseFakeRuntimeJob):
 class TimedRuntimeJob(BaseFakeRuntimeJob):
     """Class for a job that runs for the input seconds."""
 
+    __slots__ = ("_runtime",)
+
     def __init__(self, **kwargs):
         self._runtime = kwargs.pop("run_time")
         super().__init__(**kwargs)
 
-    def _auto_progress(self):
+    async def _auto_progress(self):
         self._status = "RUNNING"
-        time.sleep(self._runtime)
+        await asyncio.sleep(self._runtime)
         self._status = "COMPLETED"
 
         if self._status == "COMPLETED":
-            self._result = json.dumps({"quasi_dists": [{0: 0.5, 3: 0.5}], "metadata": []})
+            self._result = _SAMPLER_RESULT
 
 
 class BaseFakeRuntimeClient:
@@ -266,6 +337,9 @@ class BaseFakeRuntimeClient:
         # pylint: disable=unused-argument
         self._programs = {}
         self._jobs = {}
+        # Secondary indices of job IDs. Dictionaries are used as insertion-ordered sets.
+        self._jobs_by_program = defaultdict(dict)
+        self._jobs_by_hgp = defaultdict(dict)
         self._job_classes = job_classes or []
         self._final_status = final_status
         self._job_kwargs = job_kwargs or {}
@@ -325,7 +399,7 @@ class BaseFakeRuntimeClient:
         channel_strategy: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Run the specified program."""
-        job_id = uuid.uuid4().hex
+        job_id = f"{next(_job_counter):032x}"
         job_cls = self._job_classes.pop(0) if len(self._job_classes) > 0 else BaseFakeRuntimeJob
         if hgp:
             hub, group, project = from_instance_format(hgp)
@@ -358,6 +432,8 @@ class BaseFakeRuntimeClient:
         )
         self.session_time = session_time
         self._jobs[job_id] = job
+        self._jobs_by_program[program_id][job_id] = None
+        self._jobs_by_hgp[(hub, group, project)][job_id] = None
         return {"id": job_id, "backend": backend_name}
 
     def job_get(self, job_id: str, exclude_params: bool = True) -> Any:
@@ -381,33 +457,38 @@ class BaseFakeRuntimeClient:
         descending=True,
     ):
         """Get all jobs."""
-        pending_statuses = ["QUEUED", "RUNNING"]
-        returned_statuses = ["COMPLETED", "FAILED", "CANCELLED"]
         limit = limit or len(self._jobs)
         skip = skip or 0
-        jobs = list(self._jobs.values())
-
-        if backend_name:
-            jobs = [job for job in jobs if job._backend == backend_name]
+        job_statuses = None
         if pending is not None:
-            job_status_list = pending_statuses if pending else returned_statuses
-            jobs = [job for job in jobs if job._status in job_status_list]
-        if program_id:
-            jobs = [job for job in jobs if job._program_id == program_id]
-        if all([hub, group, project]):
-            jobs = [
-                job
-                for job in jobs
-                if job._hub == hub and job._group == group and job._project == project
+            job_statuses = _PENDING_STATUSES if pending else _RETURNED_STATUSES
+        filter_hgp = all([hub, group, project])
+
+        def _matches(job):
+            """Return whether the job passes all the requested filters."""
+            return (
+                (not backend_name or job._backend_name == backend_name)
+                and (job_statuses is None or job._status in job_statuses)
+                and (not job_tags or job._job_tags == job_tags)
+                and (not session_id or job._session_id == session_id)
+                and (not created_after or job._creation_date >= created_after)
+                and (not created_before or job._creation_date <= created_before)
+            )
+
+        # Narrow down the candidates using the indices before looking at the jobs.
+        job_ids = self._jobs.keys()
+        if program_id and filter_hgp:
+            hgp_job_ids = self._jobs_by_hgp.get((hub, group, project), {})
+            job_ids = [
+                job_id
+                for job_id in self._jobs_by_program.get(program_id, {})
+                if job_id in hgp_job_ids
             ]
-        if job_tags:
-            jobs = [job for job in jobs if job._job_tags == job_tags]
-        if session_id:
-            jobs = [job for job in jobs if job._session_id == session_id]
-        if created_after:
-            jobs = [job for job in jobs if job._creation_date >= created_after]
-            jobs = [job for job in jobs if job._creation_date <= created_before]
-
+        elif program_id:
+            job_ids = self._jobs_by_program.get(program_id, {}).keys()
+        elif filter_hgp:
+            job_ids = self._jobs_by_hgp.get((hub, group, project), {}).keys()
+        jobs = [self._jobs[job_id] for job_id in job_ids if _matches(self._jobs[job_id])]
         count = len(jobs)
         jobs = jobs[skip : limit + skip]
         if descending is False:
@@ -429,14 +510,15 @@ class BaseFakeRuntimeClient:
 
     def job_delete(self, job_id):
         """Delete the job."""
-        self._get_job(job_id)
+        job = self._get_job(job_id)
         del self._jobs[job_id]
+        del self._jobs_by_program[job._program_id][job_id]
+        del self._jobs_by_hgp[(job._hub, job._group, job._project)][job_id]
 
     def wait_for_final_state(self, job_id):
         """Wait for the final state of a program job."""
-        final_states = ["COMPLETED", "FAILED", "CANCELLED", "CANCELLED - RAN TOO LONG"]
         status = self._get_job(job_id).status()
-        while status not in final_states:
+        while status not in _FINAL_STATUSES:
             status = self._get_job(job_id).status()
 
     # pylint: disable=unused-argument
@@ -12,23 +12,26 @@
 
 """Tests for runtime data serialization."""
 
+import gc
 import json
 import os
 import subprocess
 import tempfile
 import warnings
 from unittest import skip
+from unittest.mock import patch
 from datetime import datetime
 
 import numpy as np
 
 from qiskit.circuit import Parameter, QuantumCircuit
 
-from qiskit.circuit.library import EfficientSU2, CXGate, PhaseGate, U2Gate
+from qiskit.circuit.library import EfficientSU2, CXGate, PhaseGate, U2Gate, XGate
 from qiskit.quantum_info import SparsePauliOp, Pauli, Statevector
 from qiskit.result import Result
 from qiskit_aer.noise import NoiseModel
 from qiskit_ibm_runtime.utils import RuntimeEncoder, RuntimeDecoder
+from qiskit_ibm_runtime.utils.json import _circuit_cache
 from qiskit_ibm_runtime.fake_provider import FakeNairobi
 from .mock.fake_runtime_client import CustomResultRuntimeJob
 from .mock.fake_runtime_service import FakeRuntimeService
@@ -92,6 +95,74 @@ class TestDataSerialization(IBMTestCase):
                     decoded = [decoded]
                 self.assertTrue(all(isinstance(item, QuantumCircuit) for item in decoded))
 
+    def test_encoder_circuit_cache(self):
+        """Test encoded circuits are reused until the circuit changes."""
+        circ = bell()
+        first = json.dumps(circ, cls=RuntimeEncoder)
+        with patch("qiskit_ibm_runtime.utils.json._serialize_circuit") as mock_serialize:
+            self.assertEqual(json.dumps(circ, cls=RuntimeEncoder), first)
+            mock_serialize.assert_not_called()
+
+        circ.x(0)
+        modified = json.dumps(circ, cls=RuntimeEncoder)
+        self.assertNotEqual(modified, first)
+        decoded = json.loads(modified, cls=RuntimeDecoder)
+        self.assertEqual(decoded, circ)
+
+    def test_encoder_circuit_cache_in_place(self):
+        """Test circuits modified in place are encoded again."""
+        custom = QuantumCircuit(1, name="x")
+        custom.h(0)
+
+        def _replace(circ):
+            circ.data[0] = circ.data[0].replace(operation=custom.to_gate())
+
+        def _condition(circ):
+            circ.data[0].operation.condition = (circ.clbits[0], 1)
+
+        def _label(circ):
+            circ.data[0].operation.label = "new_label"
+
+        for modify in [_replace, _condition, _label]:
+            with self.subTest(modify=modify.__name__):
+                circ = QuantumCircuit(1, 1)
+                circ.append(XGate().to_mutable(), [0])
+                circ.measure(0, 0)
+                json.dumps(circ, cls=RuntimeEncoder)
+                modify(circ)
+                decoded = json.loads(json.dumps(circ, cls=RuntimeEncoder), cls=RuntimeDecoder)
+                operation = decoded.data[0].operation
+                self.assertEqual(operation.condition, circ.data[0].operation.condition)
+                self.assertEqual(operation.label, circ.data[0].operation.label)
+                self.assertEqual(operation.definition, circ.data[0].operation.definition)
+
+    def test_encoder_circuit_cache_collected(self):
+        """Test cached encodings are released with their circuit."""
+        circ = bell()
+        json.dumps(circ, cls=RuntimeEncoder)
+        self.assertTrue(any(ref() is circ for ref, _ in _circuit_cache.values()))
+        del circ
+        gc.collect()
+        self.assertTrue(all(ref() is not None for ref, _ in _circuit_cache.values()))
+
+    def test_encoder_circuit_cache_reused_id(self):
+        """Test a circuit reusing the id of a cached circuit is encoded again."""
+
+        def _circuit(gate_name):
+            sub_circ = QuantumCircuit(1, name="g")
+            getattr(sub_circ, gate_name)(0)
+            circ = QuantumCircuit(1, name="c")
+            circ.append(sub_circ.to_gate(), [0])
+            return circ
+
+        circ_x = _circuit("x")
+        circ_h = _circuit("h")
+        with patch("qiskit_ibm_runtime.utils.json.id", create=True, return_value=0):
+            json.dumps(circ_x, cls=RuntimeEncoder)
+            encoded = json.dumps(circ_h, cls=RuntimeEncoder)
+        decoded = json.loads(encoded, cls=RuntimeDecoder)
+        self.assertEqual(decoded.data[0].operation.definition, circ_h.data[0].operation.definition)
+
     @skip("Skip until qiskit-ibm-provider/736 is merged")
     def test_coder_operators(self):
         """Test runtime encoder and decoder for operators."""
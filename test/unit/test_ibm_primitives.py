@@ -122,6 +122,27 @@ class TestPrimitives(IBMTestCase):
                 options.transpilation.skip_transpilation = False
                 self.assertTrue(inst.options.get("transpilation").get("skip_transpilation"))
 
+    def test_dict_options_copied(self):
+        """Test modifying original dictionary options does not affect primitives."""
+        primitives = [Sampler, Estimator]
+        for cls in primitives:
+            with self.subTest(primitive=cls):
+                options = {"transpilation": {"initial_layout": [1, 2]}}
+                inst = cls(session=MagicMock(spec=MockSession), options=options)
+                options["transpilation"]["initial_layout"].append(3)
+                self.assertEqual(inst.options.get("transpilation").get("initial_layout"), [1, 2])
+
+    def test_default_options_not_shared(self):
+        """Test primitives do not share the default options."""
+        primitives = [Sampler, Estimator]
+        for cls in primitives:
+            with self.subTest(primitive=cls):
+                inst = cls(session=MagicMock(spec=MockSession))
+                inst._options["environment"]["job_tags"].append("foo")
+                other = cls(session=MagicMock(spec=MockSession))
+                self.assertEqual(other.options.environment["job_tags"], [])
+                self.assertDictEqual(other._options, asdict(Options()))
+
     def test_init_with_backend_str(self):
         """Test initializing a primitive with a backend name."""
         primitives = [Sampler, Estimator]
@@ -12,14 +12,19 @@
 
 """Tests for Session classession."""
 
+import gc
+import weakref
 from unittest.mock import MagicMock, patch
 
+from qiskit.providers.jobstatus import JobStatus
+
 from qiskit_ibm_runtime.fake_provider import FakeManila
 from qiskit_ibm_runtime import Session
 from qiskit_ibm_runtime.ibm_backend import IBMBackend
 from qiskit_ibm_runtime.utils.default_session import _DEFAULT_SESSION
 from .mock.fake_runtime_service import FakeRuntimeService
 from ..ibm_test_case import IBMTestCase
+from ..utils import bell
 
 
 class TestSession(IBMTestCase):
@@ -119,7 +124,10 @@ class TestSession(IBMTestCase):
         )
         _, kwargs = service.run.call_args
         self.assertEqual(kwargs["program_id"], program_id)
-        self.assertDictEqual(kwargs["options"], {"backend": backend, **options})
+        self.assertDictEqual(
+            kwargs["options"], {"instance": session._instance, "backend": backend, **options}
+        )
+        self.assertDictEqual(options, {"log_level": "INFO"})
         self.assertDictEqual(kwargs["inputs"], inputs)
         self.assertEqual(kwargs["result_decoder"], decoder)
         self.assertEqual(session.backend(), backend)
@@ -164,3 +172,130 @@ class TestSession(IBMTestCase):
         session = Session.from_id(session_id=session_id, service=service)
         session.run(program_id="foo", inputs={})
         self.assertEqual(session.session_id, session_id)
+
+    def test_closed_status_cached(self):
+        """Test the status of a closed session is not queried again."""
+        service = MagicMock()
+        service._api_client.session_details.return_value = {
+            "state": "closed",
+            "accepting_jobs": False,
+        }
+        session = Session.from_id(session_id="123", service=service)
+        self.assertEqual(session.status(), "Closed")
+        self.assertEqual(session.status(), "Closed")
+        service._api_client.session_details.assert_called_once_with("123")
+
+    def test_results(self):
+        """Test retrieving the results of all jobs in a session."""
+        service = MagicMock()
+        jobs = [MagicMock() for _ in range(3)]
+        for idx, job in enumerate(jobs):
+            job.result.return_value = idx
+        service.run.side_effect = jobs
+        session = Session(service=service, backend="ibm_gotham", track_jobs=True)
+        self.assertEqual(session.results(), [])
+        for _ in jobs:
+            session.run(program_id="foo", inputs={})
+        self.assertEqual(session.results(timeout=10), [0, 1, 2])
+        for job in jobs:
+            job.result.assert_called_once_with(timeout=10)
+        self.assertEqual(session.results(), [])
+
+    def test_results_failed(self):
+        """Test jobs are kept if retrieving their results fails."""
+        service = MagicMock()
+        job = MagicMock()
+        job.result.side_effect = [RuntimeError("Failed to get result."), 0]
+        service.run.return_value = job
+        session = Session(service=service, backend="ibm_gotham", track_jobs=True)
+        session.run(program_id="foo", inputs={})
+        with self.assertRaises(RuntimeError):
+            session.results()
+        self.assertEqual(session.results(), [0])
+        self.assertEqual(session.results(), [])
+
+    def test_jobs_not_tracked(self):
+        """Test the session does not keep its jobs by default."""
+        service = MagicMock()
+        service.run.side_effect = lambda **kwargs: MagicMock()
+        session = Session(service=service, backend="ibm_gotham")
+        job_ref = weakref.ref(session.run(program_id="foo", inputs={}))
+        gc.collect()
+        self.assertIsNone(job_ref())
+        with self.assertRaises(RuntimeError):
+            session.results()
+
+    def test_run_cache(self):
+        """Test repeated runs reuse the cached job."""
+        service = MagicMock()
+        service.run.side_effect = lambda **kwargs: MagicMock()
+        inputs = {"circuits": bell(), "parameters": [[0.1, 0.2]]}
+        session = Session(service=service, backend="ibm_gotham", cache=True)
+        job = session.run(program_id="foo", inputs=inputs)
+        self.assertIs(session.run(program_id="foo", inputs=dict(inputs)), job)
+        service.run.assert_called_once()
+
+        subtests = [
+            {"program_id": "bar", "inputs": inputs},
+            {"program_id": "foo", "inputs": {**inputs, "parameters": [[0.3, 0.4]]}},
+            {"program_id": "foo", "inputs": inputs, "options": {"log_level": "INFO"}},
+        ]
+        for kwargs in subtests:
+            with self.subTest(kwargs=kwargs):
+                self.assertIsNot(session.run(**kwargs), job)
+
+        session = Session(service=service, backend="ibm_gotham")
+        self.assertIsNot(
+            session.run(program_id="foo", inputs=inputs),
+            session.run(program_id="foo", inputs=inputs),
+        )
+
+    def test_run_cache_results(self):
+        """Test cached jobs are included in the session results."""
+        service = MagicMock()
+        job = MagicMock()
+        job.result.return_value = 0
+        service.run.return_value = job
+        session = Session(service=service, backend="ibm_gotham", cache=True, track_jobs=True)
+        session.run(program_id="foo", inputs={})
+        session.run(program_id="foo", inputs={})
+        service.run.assert_called_once()
+        self.assertEqual(session.results(), [0, 0])
+
+    def test_run_cache_size(self):
+        """Test the least recently used jobs are evicted from the cache."""
+        service = MagicMock()
+        service.run.side_effect = lambda **kwargs: MagicMock()
+        session = Session(service=service, backend="ibm_gotham", cache=True)
+        session._MAX_CACHED_JOBS = 2
+        first_job = session.run(program_id="foo", inputs={"x": 0})
+        session.run(program_id="foo", inputs={"x": 1})
+        self.assertIs(session.run(program_id="foo", inputs={"x": 0}), first_job)
+        session.run(program_id="foo", inputs={"x": 2})
+        self.assertIs(session.run(program_id="foo", inputs={"x": 0}), first_job)
+        self.assertEqual(service.run.call_count, 3)
+        session.run(program_id="foo", inputs={"x": 1})
+        self.assertEqual(service.run.call_count, 4)
+
+    def test_run_cache_failed_job(self):
+        """Test failed or cancelled cached jobs are submitted again."""
+        service = MagicMock()
+        service.run.side_effect = lambda **kwargs: MagicMock()
+        session = Session(service=service, backend="ibm_gotham", cache=True)
+        for status in [JobStatus.ERROR, JobStatus.CANCELLED]:
+            with self.subTest(status=status):
+                job = session.run(program_id="foo", inputs={})
+                job.status.return_value = status
+                new_job = session.run(program_id="foo", inputs={})
+                self.assertIsNot(new_job, job)
+                self.assertIs(session.run(program_id="foo", inputs={}), new_job)
+
+    def test_run_cache_no_backend(self):
+        """Test the cache is used when the backend is set by the first job."""
+        service = MagicMock()
+        service.run.side_effect = lambda **kwargs: MagicMock()
+        with self.assertWarns(DeprecationWarning):
+            session = Session(service=service, cache=True)
+        job = session.run(program_id="foo", inputs={})
+        self.assertIs(session.run(program_id="foo", inputs={}), job)
+        service.run.assert_called_once()